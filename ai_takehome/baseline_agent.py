@@ -1,24 +1,102 @@
-import argparse, pandas as pd, pathlib, json, re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import argparse, functools, joblib, numpy as np, os, pandas as pd, pathlib, json, re, sklearn, tempfile
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 
 DATA_PATH = pathlib.Path(__file__).parent / "data" / "denials.csv"
+INDEX_PATH = DATA_PATH.with_suffix(".index.joblib")
+TOP_K = 3
+N_FEATURES = 2**18
+# Bump INDEX_VERSION whenever build_index() or the tuple it returns changes;
+# together with the build parameters and library version it keys the cache.
+INDEX_VERSION = 1
+INDEX_KEY = (INDEX_VERSION, N_FEATURES, sklearn.__version__)
 
 def load_docs():
     df = pd.read_csv(DATA_PATH)
-    docs = df.apply(lambda r: f"Department {r['department']} denied because {r['denial_reason']} on {r['date']}", axis=1).tolist()
+    docs = ("Department " + df['department'].astype(str)
+            + " denied because " + df['denial_reason'].astype(str)
+            + " on " + df['service_date'].astype(str)).tolist()
     return docs, df
 
-def answer(question: str) -> str:
+def build_index():
+    """Fit the IDF weights and precompute everything answer() reads."""
     docs, df = load_docs()
-    vect = TfidfVectorizer().fit(docs + [question])
-    doc_vecs = vect.transform(docs)
-    q_vec = vect.transform([question])
-    sims = cosine_similarity(q_vec, doc_vecs).flatten()
-    top_idx = sims.argsort()[-3:][::-1]
-    rows = df.iloc[top_idx]
-    reason_counts = rows['denial_reason'].value_counts().to_dict()
-    answer_parts = [f"{k}: {v}" for k,v in reason_counts.items()]
+    hasher = HashingVectorizer(n_features=N_FEATURES, alternate_sign=False, norm=None,
+                               dtype=np.float32)
+    counts = hasher.transform(docs)
+    tfidf = TfidfTransformer(norm="l2", sublinear_tf=True).fit(counts)
+    doc_vecs = tfidf.transform(counts)
+    # Only the hash buckets the corpus occupies can score, so keep a dense
+    # float32 copy of just those columns for a BLAS mat-vec per question.
+    cols = np.unique(doc_vecs.indices)
+    doc_mat = np.ascontiguousarray(doc_vecs[:, cols].toarray())
+    reason_codes, reasons = pd.factorize(df['denial_reason'])
+    return hasher, tfidf, cols, doc_mat, reason_codes, reasons
+
+def _index_key():
+    """INDEX_KEY plus the CSV's size and mtime; any change to the file (even to
+    an older timestamp, as cp -p or a backup restore gives) invalidates the index."""
+    st = DATA_PATH.stat()
+    return INDEX_KEY + (st.st_size, st.st_mtime_ns)
+
+def _read_index(key):
+    """Return the persisted index, or None if it is missing, stale or unreadable."""
+    if not INDEX_PATH.exists():
+        return None
+    try:
+        # Uncompressed dumps let the numpy arrays be memory-mapped read-only.
+        payload = joblib.load(INDEX_PATH, mmap_mode="r")
+    except Exception:
+        return None  # corrupt or written by an incompatible version: rebuild
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        return None
+    return payload["index"]
+
+def _write_index(key, index):
+    """Atomically replace INDEX_PATH so readers never see a partial dump."""
+    fd, tmp = tempfile.mkstemp(dir=INDEX_PATH.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump({"key": key, "index": index}, tmp, compress=0)
+        os.replace(tmp, INDEX_PATH)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+@functools.lru_cache(maxsize=None)
+def load_index():
+    """Load the on-disk index, rebuilding it when the CSV or INDEX_KEY changed.
+
+    The first call writes data/denials.index.joblib next to the CSV.
+    """
+    # Stat before building, so a CSV rewritten mid-build is caught next time
+    key = _index_key()
+    index = _read_index(key)
+    if index is not None:
+        return index
+    index = build_index()
+    try:
+        _write_index(key, index)
+    except OSError:
+        pass  # read-only checkout: keep the in-memory index
+    return index
+
+def answer(question: str) -> str:
+    hasher, tfidf, cols, doc_mat, reason_codes, reasons = load_index()
+    q_vec = tfidf.transform(hasher.transform([question]))
+    # TfidfTransformer rows are L2-normalized, so the dot product is the cosine.
+    pos = np.searchsorted(cols, q_vec.indices)
+    hit = pos < cols.size
+    hit[hit] = cols[pos[hit]] == q_vec.indices[hit]
+    q_dense = np.zeros(cols.size, dtype=doc_mat.dtype)
+    q_dense[pos[hit]] = q_vec.data[hit]
+    sims = doc_mat @ q_dense
+    k = min(TOP_K, sims.size)
+    idx = np.argpartition(sims, -k)[-k:]
+    top_idx = idx[np.argsort(sims[idx])[::-1]]
+    # Most frequent reason first; ties keep retrieval rank order.
+    codes, first, counts = np.unique(reason_codes[top_idx], return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))
+    answer_parts = [f"{reasons[codes[i]]}: {counts[i]}" for i in order]
     return " | ".join(answer_parts)
 
 if __name__ == "__main__":
@@ -1,15 +1,17 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from .transform import transform_record
-import json, pathlib
+import orjson, pathlib
 
 app = FastAPI()
 
 @app.on_event("startup")
 def ingest():
     sample_path = pathlib.Path(__file__).parent.parent / "data" / "sample_remittance.json"
-    records = json.loads(sample_path.read_text())
-    global normalized
+    records = orjson.loads(sample_path.read_bytes())
+    global normalized, normalized_json
     normalized = [transform_record(r) for r in records]
+    # The feed is static after startup, so serialize it once.
+    normalized_json = orjson.dumps(normalized)
 
 @app.get("/healthz")
 def healthz():
@@ -17,4 +19,4 @@ def healthz():
 
 @app.get("/claims")
 def claims():
-    return normalized
+    return Response(content=normalized_json, media_type="application/json")
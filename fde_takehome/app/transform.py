@@ -19,5 +19,5 @@ def transform_record(rec: dict) -> dict:
         "amount": float(rec["amount"]),
         "denial_reason": rec["issue"],
         "department": rec["department"],
-        "service_date": rec["service_date"].split("T")[0] if "T" in rec["service_date"] else rec["service_date"]
+        "service_date": rec["service_date"].partition("T")[0]
     }
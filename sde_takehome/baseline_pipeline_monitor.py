@@ -11,14 +11,61 @@ This is a basic implementation that candidates should enhance with:
 """
 
 import argparse
+import bisect
 import json
+import mmap
+import os
 import re
+import stat
+import sys
+from array import array
 from collections import defaultdict, Counter
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Any, Tuple, Optional
 from enum import Enum
+from operator import itemgetter
 import statistics
 
+try:
+    import ciso8601  # optional C parser for ISO-8601 timestamps
+except ImportError:
+    ciso8601 = None
+
+try:
+    import orjson  # optional C JSON parser; json.loads accepts bytes too
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# parse_timestamp(value) parses an ISO-8601 timestamp, including a trailing
+# 'Z' for UTC. The parser is picked once here so callers pay a single C call.
+if ciso8601 is not None:
+    parse_timestamp = ciso8601.parse_datetime
+elif sys.version_info >= (3, 11):
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = _EPOCH.replace(tzinfo=None)  # naive timestamps are taken as UTC
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamps_micros(values: Iterable[str]) -> List[int]:
+    """Parse ISO-8601 timestamps to integer microseconds since the epoch."""
+    return [(timestamp - (_EPOCH if timestamp.tzinfo is not None else _NAIVE_EPOCH)) // _MICROSECOND
+            for timestamp in map(parse_timestamp, values)]
+
+
+def whole_number(value: float) -> Any:
+    """Return an integral float as int, so whole durations print as they were read."""
+    return int(value) if value.is_integer() else value
+
 
 class PipelineStatus(Enum):
     RUNNING = "RUNNING"
@@ -29,6 +76,13 @@ class PipelineStatus(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Statuses are stored as one-byte codes: the member's index in _STATUSES.
+_STATUSES = tuple(PipelineStatus)
+_STATUS_CODES = {status.value: code for code, status in enumerate(_STATUSES)}
+_SUCCESS_CODE = _STATUS_CODES[PipelineStatus.SUCCESS.value]
+_FAILED_CODE = _STATUS_CODES[PipelineStatus.FAILED.value]
+_UNKNOWN_CODE = _STATUS_CODES[PipelineStatus.UNKNOWN.value]
+
 class AlertSeverity(Enum):
     LOW = "LOW"
     MEDIUM = "MEDIUM"
@@ -37,6 +91,8 @@ class AlertSeverity(Enum):
 
 
 class Alert:
+    __slots__ = ('pipeline_id', 'severity', 'message', 'team', 'timestamp')
+    
     def __init__(self, pipeline_id: str, severity: AlertSeverity, message: str, 
                  team: str, timestamp: datetime):
         self.pipeline_id = pipeline_id
@@ -55,82 +111,124 @@ class Alert:
         }
 
 
-class PipelineExecution:
-    def __init__(self, execution_id: str, pipeline_id: str, status: str, 
-                 start_time: str, end_time: str, duration: int, 
-                 records_processed: int, team: str):
-        self.execution_id = execution_id
-        self.pipeline_id = pipeline_id
-        # Handle unknown statuses gracefully
-        try:
-            self.status = PipelineStatus(status)
-        except ValueError:
-            self.status = PipelineStatus.UNKNOWN
-        self.start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        self.end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00')) if end_time else None
-        self.duration = duration if duration is not None else 0  # seconds
-        self.records_processed = records_processed if records_processed is not None else 0
-        self.team = team
+@dataclass(slots=True)
+class PipelineMetrics:
+    """Running per-pipeline aggregates; averages are derived on read."""
+    total_executions: int = 0
+    successful_executions: int = 0
+    failed_executions: int = 0
+    sum_duration: float = 0
+    count_duration: int = 0
+    sum_records_processed: int = 0
+    count_records_processed: int = 0
+    last_execution: Optional[datetime] = None
+    team: Optional[str] = None
 
 
 class PipelineMonitor:
     """Basic pipeline monitoring system with room for improvement."""
     
     def __init__(self):
-        self.executions = []
-        self.pipeline_metrics = defaultdict(lambda: {
-            'total_executions': 0,
-            'successful_executions': 0,
-            'failed_executions': 0,
-            'avg_duration': 0,
-            'avg_records_processed': 0,
-            'last_execution': None,
-            'team': None
-        })
+        # Executions are stored column-wise (one parallel sequence per field
+        # the queries read) so scans only touch the fields they need.
+        # Team and records_processed only feed the per-pipeline aggregates,
+        # so they are folded in at ingest rather than stored per execution.
+        self.pipeline_ids: List[str] = []
+        self.statuses = array('b')  # status codes, see _STATUSES
+        self.start_times = array('q')  # microseconds since the epoch (UTC)
+        self.durations = array('d')  # seconds; JSON may carry fractional values
+        self.pipeline_metrics: Dict[str, PipelineMetrics] = defaultdict(PipelineMetrics)
         self.alerts = []
+        # pipeline_id -> (sorted start times, matching row indices); built lazily
+        self._trend_index: Optional[Dict[str, Tuple[array, array]]] = None
         
     def load_executions(self, data_file: str) -> None:
         """Load pipeline execution data from file."""
-        with open(data_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line.strip())
-                    execution = PipelineExecution(
-                        execution_id=data['execution_id'],
-                        pipeline_id=data['pipeline_id'],
-                        status=data['status'],
-                        start_time=data['start_time'],
-                        end_time=data['end_time'],
-                        duration=data['duration'],
-                        records_processed=data['records_processed'],
-                        team=data['team']
-                    )
-                    self.execution.append(execution)
-                    self._update_pipeline_metrics(execution)
+        with open(data_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            # isspace() skips blank lines without copying them like strip()
+            if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                # Map the file instead of copying it through a read buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    records = [json_loads(line) for line in iter(mm.readline, b'') if not line.isspace()]
+            else:
+                # Pipes, FIFOs and empty files can't be mapped; stream them
+                records = [json_loads(line) for line in f if not line.isspace()]
+        # Build the batch's columns and metrics before touching the store,
+        # so a malformed record raises without leaving a partial batch behind
+        pipeline_ids, statuses, start_times, durations = self._build_columns(records)
+        batch_metrics = self._fold_metrics(records, pipeline_ids, statuses, durations)
+        self._append_columns(pipeline_ids, statuses, start_times, durations)
+        self._merge_metrics(batch_metrics)
+        self._trend_index = None
     
-    def _update_pipeline_metrics(self, execution: PipelineExecution) -> None:
-        """Update metrics for a pipeline based on execution data."""
-        metrics = self.pipeline_metrics[execution.pipeline_id]
-        metrics['total_executions'] += 1
-        metrics['team'] = execution.team
-        
-        if execution.status == PipelineStatus.SUCCESS:
-            metrics['successful_executions'] += 1
-        elif execution.status == PipelineStatus.FAILED:
-            metrics['failed_executions'] += 1
-        
-        # Update averages (simplified - candidates should improve this)
-        if execution.duration and execution.duration > 0:
-            current_avg = metrics['avg_duration']
-            total_execs = metrics['total_executions']
-            metrics['avg_duration'] = ((current_avg * (total_execs - 1)) + execution.duration) / total_execs
-        
-        if execution.records_processed and execution.records_processed > 0:
-            current_avg = metrics['avg_records_processed']
-            total_execs = metrics['total_executions']
-            metrics['avg_records_processed'] = ((current_avg * (total_execs - 1)) + execution.records_processed) / total_execs
+    def _build_columns(self, records: List[Dict[str, Any]]) -> Tuple[List[str], array, array, array]:
+        """Convert parsed execution records to columns, a column at a time."""
+        # A handful of ids repeat across every row; interning shares one str
+        # per id so metric dict lookups hit the identity fast path.
+        pipeline_ids = list(map(sys.intern, map(itemgetter('pipeline_id'), records)))
+        # Handle unknown statuses and missing numbers gracefully
+        statuses = array('b', [_STATUS_CODES.get(status, _UNKNOWN_CODE) for status in map(itemgetter('status'), records)])
+        start_times = array('q', timestamps_micros(map(itemgetter('start_time'), records)))
+        durations = array('d', [value or 0 for value in map(itemgetter('duration'), records)])
+        return pipeline_ids, statuses, start_times, durations
+    
+    def _append_columns(self, pipeline_ids: List[str], statuses: array,
+                        start_times: array, durations: array) -> None:
+        """Append a batch built by _build_columns to the column store."""
+        self.pipeline_ids.extend(pipeline_ids)
+        self.statuses.extend(statuses)
+        self.start_times.extend(start_times)
+        self.durations.extend(durations)
+    
+    def _fold_metrics(self, records: List[Dict[str, Any]], pipeline_ids: List[str],
+                      statuses: array, durations: array) -> Dict[str, PipelineMetrics]:
+        """Fold a batch of records into fresh per-pipeline metrics for _merge_metrics."""
+        batch_metrics: Dict[str, PipelineMetrics] = defaultdict(PipelineMetrics)
+        last_row = {}
+        columns = zip(pipeline_ids, statuses, durations, map(itemgetter('team'), records),
+                      map(itemgetter('records_processed'), records))
+        for row, (pipeline_id, status, duration, team, records_processed) in enumerate(columns):
+            metrics = batch_metrics[pipeline_id]
+            metrics.total_executions += 1
+            metrics.team = team
+            
+            if status == _SUCCESS_CODE:
+                metrics.successful_executions += 1
+            elif status == _FAILED_CODE:
+                metrics.failed_executions += 1
+            
+            # Keep running sums; averages are derived on read in get_pipeline_health.
+            # Float sums of whole-second durations stay exact below 2**53.
+            if duration > 0:
+                metrics.sum_duration += duration
+                metrics.count_duration += 1
+            
+            if records_processed and records_processed > 0:
+                metrics.sum_records_processed += records_processed
+                metrics.count_records_processed += 1
+            
+            last_row[pipeline_id] = row
         
-        metrics['last_execution'] = execution.start_time
+        # Re-parse the source string rather than the microsecond column, so
+        # last_execution keeps the input's UTC offset (or lack of one)
+        for pipeline_id, row in last_row.items():
+            batch_metrics[pipeline_id].last_execution = parse_timestamp(records[row]['start_time'])
+        return batch_metrics
+    
+    def _merge_metrics(self, batch_metrics: Dict[str, PipelineMetrics]) -> None:
+        """Add a batch folded by _fold_metrics into the running per-pipeline metrics."""
+        for pipeline_id, batch in batch_metrics.items():
+            metrics = self.pipeline_metrics[pipeline_id]
+            metrics.total_executions += batch.total_executions
+            metrics.successful_executions += batch.successful_executions
+            metrics.failed_executions += batch.failed_executions
+            metrics.sum_duration += batch.sum_duration
+            metrics.count_duration += batch.count_duration
+            metrics.sum_records_processed += batch.sum_records_processed
+            metrics.count_records_processed += batch.count_records_processed
+            metrics.last_execution = batch.last_execution
+            metrics.team = batch.team
     
     def get_pipeline_health(self, pipeline_id: Optional[str] = None) -> Dict[str, Any]:
         """Get health status for a specific pipeline or all pipelines."""
@@ -139,27 +237,29 @@ class PipelineMonitor:
                 return {'error': f'Pipeline {pipeline_id} not found'}
             
             metrics = self.pipeline_metrics[pipeline_id]
-            success_rate = (metrics['successful_executions'] / metrics['total_executions'] * 100) if metrics['total_executions'] > 0 else 0
+            success_rate = (metrics.successful_executions / metrics.total_executions * 100) if metrics.total_executions > 0 else 0
+            avg_duration = (metrics.sum_duration / metrics.count_duration) if metrics.count_duration > 0 else 0
+            avg_records_processed = (metrics.sum_records_processed / metrics.count_records_processed) if metrics.count_records_processed > 0 else 0
             
             return {
                 'pipeline_id': pipeline_id,
                 'success_rate': success_rate,
-                'total_executions': metrics['total_executions'],
-                'failed_executions': metrics['failed_executions'],
-                'avg_duration': metrics['avg_duration'],
-                'avg_records_processed': metrics['avg_records_processed'],
-                'last_execution': metrics['last_execution'].isoformat() if metrics['last_execution'] else None,
-                'team': metrics['team']
+                'total_executions': metrics.total_executions,
+                'failed_executions': metrics.failed_executions,
+                'avg_duration': avg_duration,
+                'avg_records_processed': avg_records_processed,
+                'last_execution': metrics.last_execution.isoformat() if metrics.last_execution else None,
+                'team': metrics.team
             }
         else:
             # Return health for all pipelines
             health_summary = {}
             for pid, metrics in self.pipeline_metrics.items():
-                success_rate = (metrics['successful_executions'] / metrics['total_executions'] * 100) if metrics['total_executions'] > 0 else 0
+                success_rate = (metrics.successful_executions / metrics.total_executions * 100) if metrics.total_executions > 0 else 0
                 health_summary[pid] = {
                     'success_rate': success_rate,
-                    'total_executions': metrics['total_executions'],
-                    'team': metrics['team']
+                    'total_executions': metrics.total_executions,
+                    'team': metrics.team
                 }
             return health_summary
     
@@ -169,11 +269,12 @@ class PipelineMonitor:
         This is a basic implementation - candidates should improve this significantly.
         """
         anomalies = []
+        now = datetime.now(timezone.utc)  # one detection time for the whole pass
         
         for pipeline_id, metrics in self.pipeline_metrics.items():
             # Simple anomaly: pipelines with <80% success rate
-            if metrics['total_executions'] >= 5:  # Only check pipelines with enough data
-                success_rate = (metrics['successful_executions'] / metrics['total_executions']) * 100
+            if metrics.total_executions >= 5:  # Only check pipelines with enough data
+                success_rate = (metrics.successful_executions / metrics.total_executions) * 100
                 
                 if success_rate < 80:
                     severity = AlertSeverity.HIGH if success_rate < 50 else AlertSeverity.MEDIUM
@@ -181,8 +282,8 @@ class PipelineMonitor:
                         pipeline_id=pipeline_id,
                         severity=severity,
                         message=f"Low success rate: {success_rate:.1f}%",
-                        team=metrics['team'],
-                        timestamp=datetime.now()
+                        team=metrics.team,
+                        timestamp=now
                     )
                     anomalies.append(alert)
         
@@ -198,12 +299,12 @@ class PipelineMonitor:
             'avg_success_rate': 0
         })
         
-        for pipeline_id, metrics in self.pipeline_metrics.items():
-            team = metrics['team']
-            team_metrics[team]['total_pipelines'] += 1
-            team_metrics[team]['total_executions'] += metrics['total_executions']
-            team_metrics[team]['successful_executions'] += metrics['successful_executions']
-            team_metrics[team]['failed_executions'] += metrics['failed_executions']
+        for metrics in self.pipeline_metrics.values():
+            team_entry = team_metrics[metrics.team]
+            team_entry['total_pipelines'] += 1
+            team_entry['total_executions'] += metrics.total_executions
+            team_entry['successful_executions'] += metrics.successful_executions
+            team_entry['failed_executions'] += metrics.failed_executions
         
         # Calculate average success rates
         for team, metrics in team_metrics.items():
@@ -212,30 +313,52 @@ class PipelineMonitor:
         
         return dict(team_metrics)
     
+    def _build_trend_index(self) -> Dict[str, Tuple[array, array]]:
+        """Group row indices by pipeline, each sorted by start time."""
+        rows_by_pipeline = defaultdict(list)
+        for row, pipeline_id in enumerate(self.pipeline_ids):
+            rows_by_pipeline[pipeline_id].append(row)
+        
+        start_time_at = self.start_times.__getitem__
+        trend_index = {}
+        for pipeline_id, rows in rows_by_pipeline.items():
+            rows.sort(key=start_time_at)
+            trend_index[pipeline_id] = (array('q', map(start_time_at, rows)), array('q', rows))
+        return trend_index
+    
     def get_performance_trends(self, pipeline_id: str, days: int = 7) -> Dict[str, Any]:
         """Get performance trends for a pipeline over the last N days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        # Make cutoff_date timezone-aware to match execution times
-        cutoff_date = cutoff_date.replace(tzinfo=self.executions[0].start_time.tzinfo) if self.executions else cutoff_date
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days) - _EPOCH) // _MICROSECOND
         
-        recent_executions = [
-            exec for exec in self.executions 
-            if exec.pipeline_id == pipeline_id and exec.start_time >= cutoff_date
-        ]
+        if self._trend_index is None:
+            self._trend_index = self._build_trend_index()
         
-        if not recent_executions:
-            return {'error': f'No executions found for {pipeline_id} in the last {days} days'}
+        window = ()
+        if pipeline_id in self._trend_index:
+            start_times, rows = self._trend_index[pipeline_id]
+            window = rows[bisect.bisect_left(start_times, cutoff):]
+        
+        total_count = 0
+        success_count = 0
+        durations = []
+        for row in window:
+            total_count += 1
+            if self.statuses[row] == _SUCCESS_CODE:
+                success_count += 1
+            duration = self.durations[row]
+            if duration > 0:
+                durations.append(duration)
         
-        durations = [exec.duration for exec in recent_executions if exec.duration > 0]
-        success_count = sum(1 for exec in recent_executions if exec.status == PipelineStatus.SUCCESS)
+        if not total_count:
+            return {'error': f'No executions found for {pipeline_id} in the last {days} days'}
         
         return {
             'pipeline_id': pipeline_id,
-            'total_executions': len(recent_executions),
-            'success_rate': (success_count / len(recent_executions)) * 100,
+            'total_executions': total_count,
+            'success_rate': (success_count / total_count) * 100,
             'avg_duration': statistics.mean(durations) if durations else 0,
-            'min_duration': min(durations) if durations else 0,
-            'max_duration': max(durations) if durations else 0,
+            'min_duration': whole_number(min(durations)) if durations else 0,
+            'max_duration': whole_number(max(durations)) if durations else 0,
             'days_analyzed': days
         }
     
@@ -250,7 +373,7 @@ class PipelineMonitor:
         elif query_type == "performance_trends":
             return self.get_performance_trends(kwargs.get('pipeline_id', ''), kwargs.get('days', 7))
         elif query_type == "total_executions":
-            return len(self.executions)
+            return len(self.pipeline_ids)
         else:
             return f"Unknown query: {query_type}"
 
@@ -278,7 +401,21 @@ def main():
     result = monitor.query(args.query, **kwargs)
     
     if isinstance(result, (dict, list)):
-        print(json.dumps(result, indent=2, default=str))
+        if orjson is not None:
+            # orjson emits non-ASCII as raw UTF-8 where json.dumps would
+            # \u-escape it; the output is otherwise the same JSON.
+            output = orjson.dumps(
+                result, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+            buffer = getattr(sys.stdout, 'buffer', None)
+            if buffer is not None:
+                # Write the bytes directly, skipping the intermediate str
+                sys.stdout.flush()
+                buffer.write(output)
+            else:
+                sys.stdout.write(output.decode())
+        else:
+            print(json.dumps(result, indent=2, default=str))
     else:
         print(result)
 
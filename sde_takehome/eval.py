@@ -9,44 +9,34 @@ Tests various aspects:
 4. Performance with large datasets
 5. Data structure efficiency
 6. Code quality and robustness
+7. Performance trends analysis
+8. Command-line interface
 """
 
-import subprocess
+import functools
 import json
+import subprocess
 import time
 import sys
 from typing import Dict, Any, List
 
+DATA_FILE = 'data/pipeline_executions.jsonl'
+
+
+@functools.lru_cache(maxsize=None)
+def get_monitor():
+    """Load the execution data once and share the monitor across tests."""
+    # Imported here so a broken monitor module fails its tests, not the harness
+    from baseline_pipeline_monitor import PipelineMonitor
+    monitor = PipelineMonitor()
+    monitor.load_executions(DATA_FILE)
+    return monitor
+
 
 def run_monitor(query: str, **kwargs) -> Any:
     """Run the monitor with a specific query."""
     try:
-        cmd = [
-            'python3', 'baseline_pipeline_monitor.py', 
-            '--data-file', 'data/pipeline_executions.jsonl',
-            '--query', query
-        ]
-        
-        # Add optional arguments
-        if 'pipeline_id' in kwargs:
-            cmd.extend(['--pipeline-id', kwargs['pipeline_id']])
-        if 'days' in kwargs:
-            cmd.extend(['--days', str(kwargs['days'])])
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode != 0:
-            print(f"Error running monitor for query '{query}': {result.stderr}")
-            return None
-        
-        # Try to parse as JSON, fallback to string
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return result.stdout.strip()
-    except subprocess.TimeoutExpired:
-        print(f"Timeout running monitor for query '{query}'")
-        return None
+        return get_monitor().query(query, **kwargs)
     except Exception as e:
         print(f"Exception running monitor for query '{query}': {e}")
         return None
@@ -132,12 +122,17 @@ def test_performance():
     """Test 4: Performance with large dataset."""
     print("\nTest 4: Performance test...")
     
+    # Time a cold load rather than the shared monitor, so parsing is measured
     start_time = time.time()
-    result = run_monitor('total_executions')
-    end_time = time.time()
-    
-    if result is None:
+    try:
+        from baseline_pipeline_monitor import PipelineMonitor
+        monitor = PipelineMonitor()
+        monitor.load_executions(DATA_FILE)
+        result = monitor.query('total_executions')
+    except Exception as e:
+        print(f"Exception running monitor for query 'total_executions': {e}")
         return False
+    end_time = time.time()
     
     execution_time = end_time - start_time
     
@@ -217,6 +212,39 @@ def test_performance_trends():
         return False
 
 
+def test_cli():
+    """Test 8: Command-line interface smoke test."""
+    print("\nTest 8: Command-line interface...")
+    
+    cmd = [
+        sys.executable, 'baseline_pipeline_monitor.py',
+        '--data-file', DATA_FILE,
+        '--query', 'total_executions'
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except subprocess.TimeoutExpired:
+        print("✗ CLI did not finish within 30s")
+        return False
+    
+    if result.returncode != 0:
+        print(f"✗ CLI exited with {result.returncode}: {result.stderr}")
+        return False
+    
+    try:
+        total = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        print(f"✗ CLI output is not JSON: {result.stdout!r}")
+        return False
+    
+    if isinstance(total, int) and total >= 1000:
+        print(f"✓ CLI reported {total} executions")
+        return True
+    else:
+        print(f"✗ Expected 1000+ executions from the CLI, found: {total!r}")
+        return False
+
+
 def main():
     """Run all evaluation tests."""
     print("=" * 60)
@@ -230,7 +258,8 @@ def main():
         test_performance,
         test_data_structures,
         test_robustness,
-        test_performance_trends
+        test_performance_trends,
+        test_cli
     ]
     
     passed = 0